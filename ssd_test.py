@@ -10,51 +10,124 @@ import json
 import csv
 import sys
 import os
+import shutil
 import re
+import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from pathlib import Path
+
+# Precompiled once; used on every drive / every user input
+_DIGITS_RE = re.compile(r'(\d+)')
+_DEV_RE = re.compile(r'^/dev/sd[a-z]$')
+
+# orjson parses smartctl's number-heavy JSON noticeably faster and reads
+# bytes directly; fall back to the stdlib parser when it isn't installed.
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+# ANSI color codes for terminal output; empty when stdout isn't a terminal
+_IS_TTY = sys.stdout.isatty()
+
+RED = '\033[91m' if _IS_TTY else ''
+GREEN = '\033[92m' if _IS_TTY else ''
+YELLOW = '\033[93m' if _IS_TTY else ''
+BLUE = '\033[94m' if _IS_TTY else ''
+MAGENTA = '\033[95m' if _IS_TTY else ''
+CYAN = '\033[96m' if _IS_TTY else ''
+WHITE = '\033[97m' if _IS_TTY else ''
+BOLD = '\033[1m' if _IS_TTY else ''
+RESET = '\033[0m' if _IS_TTY else ''
+
+
+# Codes are bound as default arguments so each call uses fast local lookups.
+# The display path calls these directly; Colors below is kept for the rest.
+def success(text, _c=GREEN, _r=RESET):
+    """Return text in green (success)"""
+    return f"{_c}{text}{_r}"
+
+
+def error(text, _c=RED, _r=RESET):
+    """Return text in red (error)"""
+    return f"{_c}{text}{_r}"
+
+
+def warning(text, _c=YELLOW, _r=RESET):
+    """Return text in yellow (warning)"""
+    return f"{_c}{text}{_r}"
+
+
+def info(text, _c=CYAN, _r=RESET):
+    """Return text in cyan (info)"""
+    return f"{_c}{text}{_r}"
+
+
+def header(text, _c=BOLD, _r=RESET):
+    """Return text in bold (header)"""
+    return f"{_c}{text}{_r}"
 
 
 class Colors:
-    """ANSI color codes for terminal output"""
-    # Check if stdout is a terminal and supports colors
-    _is_tty = sys.stdout.isatty()
-
-    # Color codes
-    RED = '\033[91m' if _is_tty else ''
-    GREEN = '\033[92m' if _is_tty else ''
-    YELLOW = '\033[93m' if _is_tty else ''
-    BLUE = '\033[94m' if _is_tty else ''
-    MAGENTA = '\033[95m' if _is_tty else ''
-    CYAN = '\033[96m' if _is_tty else ''
-    WHITE = '\033[97m' if _is_tty else ''
-    BOLD = '\033[1m' if _is_tty else ''
-    RESET = '\033[0m' if _is_tty else ''
-
-    @classmethod
-    def success(cls, text):
-        """Return text in green (success)"""
-        return f"{cls.GREEN}{text}{cls.RESET}"
-
-    @classmethod
-    def error(cls, text):
-        """Return text in red (error)"""
-        return f"{cls.RED}{text}{cls.RESET}"
-
-    @classmethod
-    def warning(cls, text):
-        """Return text in yellow (warning)"""
-        return f"{cls.YELLOW}{text}{cls.RESET}"
-
-    @classmethod
-    def info(cls, text):
-        """Return text in cyan (info)"""
-        return f"{cls.CYAN}{text}{cls.RESET}"
-
-    @classmethod
-    def header(cls, text):
-        """Return text in bold (header)"""
-        return f"{cls.BOLD}{text}{cls.RESET}"
+    """Namespace for the color codes and helpers above"""
+    RED = RED
+    GREEN = GREEN
+    YELLOW = YELLOW
+    BLUE = BLUE
+    MAGENTA = MAGENTA
+    CYAN = CYAN
+    WHITE = WHITE
+    BOLD = BOLD
+    RESET = RESET
+
+    success = staticmethod(success)
+    error = staticmethod(error)
+    warning = staticmethod(warning)
+    info = staticmethod(info)
+    header = staticmethod(header)
+
+
+# Static output fragments, formatted once instead of on every print
+_HEADER_BAR = header("=" * 60)
+_PLAIN_BAR = "=" * 60
+_DASH_BAR = "-" * 60
+_WARN_NONE = success('None')
+
+# Severity bucket (0=ok, 1=warning, 2=critical) -> color
+_SEV = (GREEN, YELLOW, RED)
+_TEMP_SEV = ('', YELLOW, RED)  # Normal temperatures stay uncolored
+
+
+def _fmt(value):
+    """Format a result value for display/CSV, showing missing values as N/A"""
+    return 'N/A' if value is None else str(value)
+
+
+def _sev(value, warn, crit, suffix='', colors=_SEV, _r=RESET):
+    """Color value by severity: ok below warn, warning from warn, critical from crit"""
+    if value is None:
+        return 'N/A'
+    color = colors[(value >= crit) + (value >= warn)]
+    if not color:
+        return f"{value}{suffix}"
+    return f"{color}{value}{suffix}{_r}"
+
+
+# smartctl sections needed for the results: info, health, capabilities
+# (self-test status) and the attribute table (also carries temperature)
+SMARTCTL_OPTIONS = ['-i', '-H', '-c', '-A']
+SMARTCTL_FULL_OPTIONS = ['-x']
+
+# CSV columns, in output order
+CSV_FIELDNAMES = [
+    'timestamp', 'model', 'serial', 'firmware', 'capacity_gb',
+    'health_status', 'power_on_hours', 'power_cycles', 'temperature_c',
+    'total_lbas_written', 'total_tb_written', 'wear_level_pct',
+    'reserved_space_pct', 'reallocated_sectors', 'pending_sectors',
+    'uncorrectable_sectors', 'self_test_result', 'warnings'
+]
 
 
 class SMARTAttribute:
@@ -76,18 +149,10 @@ class SMARTAttribute:
 def check_dependencies():
     """Verify smartctl is installed and script has sudo privileges"""
     # Check for smartctl
-    try:
-        result = subprocess.run(['which', 'smartctl'],
-                              capture_output=True,
-                              text=True,
-                              check=False)
-        if result.returncode != 0:
-            print(Colors.error("ERROR: smartctl not found. Please install smartmontools:"))
-            print("  Ubuntu/Debian: sudo apt-get install smartmontools")
-            print("  Fedora/RHEL: sudo dnf install smartmontools")
-            return False
-    except Exception as e:
-        print(Colors.error(f"ERROR: Failed to check for smartctl: {e}"))
+    if shutil.which('smartctl') is None:
+        print(Colors.error("ERROR: smartctl not found. Please install smartmontools:"))
+        print("  Ubuntu/Debian: sudo apt-get install smartmontools")
+        print("  Fedora/RHEL: sudo dnf install smartmontools")
         return False
 
     # Check for root/sudo privileges
@@ -99,8 +164,37 @@ def check_dependencies():
     return True
 
 
+def _human_size(num_bytes):
+    """Format a byte count the way lsblk does (1024-based, e.g. 465.8G)"""
+    units = ('B', 'K', 'M', 'G', 'T', 'P')
+    size = float(num_bytes)
+    unit = 0
+    while size >= 1024 and unit < len(units) - 1:
+        size /= 1024
+        unit += 1
+    return f"{size:.1f}".rstrip('0').rstrip('.') + units[unit]
+
+
+def _sys_block_devices():
+    """List sd* disks straight from /sys/block (no lsblk subprocess)"""
+    devices = []
+    with os.scandir('/sys/block') as entries:
+        for entry in entries:
+            # /sys/block only holds whole disks, never partitions
+            if entry.name.startswith('sd'):
+                with open(f'/sys/block/{entry.name}/size') as f:
+                    sectors = int(f.read())  # always 512-byte units
+                devices.append((entry.name, _human_size(sectors * 512)))
+    return sorted(devices)
+
+
 def list_block_devices():
     """List available block devices, filtering for likely USB-SATA drives"""
+    try:
+        return _sys_block_devices()
+    except FileNotFoundError:
+        pass  # No sysfs available; fall back to lsblk
+
     try:
         result = subprocess.run(['lsblk', '-d', '-n', '-o', 'NAME,SIZE,TYPE'],
                               capture_output=True,
@@ -125,12 +219,11 @@ def list_block_devices():
 def validate_device_path(device_path):
     """Validate device path to prevent command injection"""
     # Must match /dev/sd[a-z] pattern
-    pattern = r'^/dev/sd[a-z]$'
-    if not re.match(pattern, device_path):
+    if not _DEV_RE.match(device_path):
         return False
 
     # Verify device exists
-    if not Path(device_path).exists():
+    if not os.path.exists(device_path):
         return False
 
     return True
@@ -141,308 +234,238 @@ def run_smartctl(device_path, options):
     cmd = ['smartctl'] + options + ['-j', device_path]
 
     try:
-        result = subprocess.run(cmd,
-                              capture_output=True,
-                              text=True,
-                              check=False)
-
-        # Parse JSON output
+        # Read stdout straight off the pipe in one go; stderr is never
+        # reported, so it is discarded rather than buffered
+        with subprocess.Popen(cmd,
+                              stdout=subprocess.PIPE,
+                              stderr=subprocess.DEVNULL) as proc:
+            output = proc.stdout.read()
+        returncode = proc.returncode
+
+        # Exit status bit 0 (bad command line) and bit 1 (device open failed)
+        # mean there is no drive data to parse. Higher bits report drive
+        # problems (e.g. bit 3 = SMART status failing) and still come with
+        # valid output, so those must be parsed.
+        if not output or returncode & 0x03:
+            print(f"ERROR: smartctl could not read {device_path} (exit status {returncode})")
+            return None, returncode
+
+        # Parse JSON output (raw bytes, no decode round-trip)
         try:
-            data = json.loads(result.stdout)
-            return data, result.returncode
+            data = _json_loads(output)
+            return data, returncode
         except json.JSONDecodeError as e:
-            print(f"ERROR: Failed to parse smartctl JSON output: {e}")
-            return None, result.returncode
+            print(f"ERROR: Failed to parse smartctl JSON output for {device_path}: {e}")
+            return None, returncode
 
     except Exception as e:
-        print(f"ERROR: Failed to execute smartctl: {e}")
+        print(f"ERROR: Failed to execute smartctl for {device_path}: {e}")
         return None, -1
 
 
-def extract_device_info(smartctl_data):
-    """Extract basic device information from smartctl output"""
-    info = {
-        'model': 'N/A',
-        'serial': 'N/A',
-        'firmware': 'N/A',
-        'capacity_gb': 'N/A'
+def _raw_value(attr):
+    """Return the raw counter value of a SMART attribute"""
+    return attr.get('raw', {}).get('value')
+
+
+def _norm_value(attr):
+    """Return the normalized value of a SMART attribute"""
+    return attr.get('value')
+
+
+def _temp_value(attr):
+    """Return current temperature from the Temperature_Celsius attribute"""
+    raw = attr.get('raw', {})
+    # Try raw string first (often has format "36 (Min/Max 2/56)")
+    if 'string' in raw:
+        match = _DIGITS_RE.match(raw['string'])
+        return int(match.group(1)) if match else None
+    # Fallback: use lowest byte of raw value (current temp usually in byte 0)
+    if 'value' in raw:
+        return raw['value'] & 0xFF
+    return None
+
+
+def _data_written(attr):
+    """Return (raw value, TB written) for a total-writes attribute (241/246)"""
+    raw_value = attr.get('raw', {}).get('value')
+    if raw_value is None:
+        return None, None
+    attr_name = attr.get('name', '')
+
+    # Check if attribute is specifically "Host_Writes_32MiB"
+    if 'Host_Writes_32MiB' in attr_name or '32MiB' in attr_name:
+        # Micron style: value is in 32 MiB units
+        return raw_value, round((raw_value * 32) / (1024 * 1024), 2)
+
+    # Standard LBA-based attribute (Crucial/Samsung/WD/Kingston)
+    # Heuristic: If value > 100,000, likely LBAs (Samsung/Intel/Crucial style)
+    # If value < 100,000, likely already in GB (WD/Kingston style)
+    if raw_value > 100000:
+        # Treat as LBA count - multiply by 512 bytes
+        return raw_value, round((raw_value * 512) / (1024**4), 2)
+    # Treat as GB already - convert to TB
+    return raw_value, round(raw_value / 1024, 2)
+
+
+# SMART attribute ID -> (field, extractor) for attributes that map straight
+# onto a result field. Vendor-dependent ones are resolved after the pass.
+_EXTRACTORS = {
+    SMARTAttribute.POWER_ON_HOURS: ('power_on_hours', _raw_value),
+    SMARTAttribute.POWER_CYCLES: ('power_cycles', _raw_value),
+    SMARTAttribute.REALLOCATED_SECTORS: ('reallocated_sectors', _raw_value),
+    SMARTAttribute.PENDING_SECTORS: ('pending_sectors', _raw_value),
+    SMARTAttribute.UNCORRECTABLE_SECTORS: ('uncorrectable_sectors', _raw_value),
+    SMARTAttribute.RESERVED_SPACE: ('reserved_space_pct', _norm_value),
+}
+
+# Vendor-specific attributes in order of precedence
+_WEAR_ATTRS = (SMARTAttribute.WEAR_LEVELING, SMARTAttribute.SSD_LIFE_LEFT, SMARTAttribute.MEDIA_WEAROUT)
+_WRITE_ATTRS = (SMARTAttribute.TOTAL_LBAS_WRITTEN, SMARTAttribute.HOST_WRITES_32MIB)
+
+
+def parse_smartctl(smartctl_data):
+    """Extract device info, health, self-test and SMART attributes in one pass"""
+    # Keys are in CSV column order; None marks a value smartctl didn't report
+    parsed = {
+        'model': None,
+        'serial': None,
+        'firmware': None,
+        'capacity_gb': None,
+        'health_status': None,
+        'power_on_hours': None,
+        'power_cycles': None,
+        'temperature_c': None,
+        'total_lbas_written': None,
+        'total_tb_written': None,
+        'wear_level_pct': None,
+        'reserved_space_pct': None,
+        'reallocated_sectors': None,
+        'pending_sectors': None,
+        'uncorrectable_sectors': None,
+        'self_test_result': None
     }
 
     if not smartctl_data:
-        return info
-
-    try:
-        # Extract model name
-        if 'model_name' in smartctl_data:
-            info['model'] = smartctl_data['model_name']
-        elif 'model_family' in smartctl_data:
-            info['model'] = smartctl_data['model_family']
-
-        # Extract serial number
-        if 'serial_number' in smartctl_data:
-            info['serial'] = smartctl_data['serial_number']
-
-        # Extract firmware version
-        if 'firmware_version' in smartctl_data:
-            info['firmware'] = smartctl_data['firmware_version']
-
-        # Extract capacity (convert to GB)
-        if 'user_capacity' in smartctl_data:
-            capacity_bytes = smartctl_data['user_capacity'].get('bytes', 0)
-            info['capacity_gb'] = round(capacity_bytes / (1024**3), 2)
-
-    except Exception as e:
-        print(f"WARNING: Error extracting device info: {e}")
-
-    return info
-
-
-def extract_smart_attributes(smartctl_data):
-    """Extract SMART attributes from smartctl output"""
-    attributes = {
-        'power_on_hours': 'N/A',
-        'power_cycles': 'N/A',
-        'temperature_c': 'N/A',
-        'reallocated_sectors': 'N/A',
-        'pending_sectors': 'N/A',
-        'uncorrectable_sectors': 'N/A',
-        'reserved_space_pct': 'N/A',
-        'wear_level_pct': 'N/A',
-        'total_lbas_written': 'N/A',
-        'total_tb_written': 'N/A'
-    }
-
-    if not smartctl_data:
-        return attributes
-
-    try:
-        # Extract temperature from top-level JSON field (more reliable)
-        if 'temperature' in smartctl_data and 'current' in smartctl_data['temperature']:
-            attributes['temperature_c'] = smartctl_data['temperature']['current']
-
-        # Extract SMART attributes if available
-        if 'ata_smart_attributes' not in smartctl_data:
-            return attributes
-
-        smart_attrs = smartctl_data['ata_smart_attributes'].get('table', [])
-
-        # Create lookup dictionary by attribute ID
-        attr_lookup = {attr['id']: attr for attr in smart_attrs}
-
-        # Extract each attribute by ID
-        if SMARTAttribute.POWER_ON_HOURS in attr_lookup:
-            attributes['power_on_hours'] = attr_lookup[SMARTAttribute.POWER_ON_HOURS]['raw']['value']
-
-        if SMARTAttribute.POWER_CYCLES in attr_lookup:
-            attributes['power_cycles'] = attr_lookup[SMARTAttribute.POWER_CYCLES]['raw']['value']
-
-        # Temperature fallback: if not found at top level, try SMART attribute
-        # Use raw string or extract from lowest byte of raw value
-        if attributes['temperature_c'] == 'N/A' and SMARTAttribute.TEMPERATURE in attr_lookup:
-            temp_attr = attr_lookup[SMARTAttribute.TEMPERATURE]
-            # Try raw string first (often has format "36 (Min/Max 2/56)")
-            if 'raw' in temp_attr and 'string' in temp_attr['raw']:
-                temp_str = temp_attr['raw']['string']
-                # Extract first number from string
-                import re
-                match = re.match(r'(\d+)', temp_str)
-                if match:
-                    attributes['temperature_c'] = int(match.group(1))
-            # Fallback: use lowest byte of raw value (current temp usually in byte 0)
-            elif 'raw' in temp_attr and 'value' in temp_attr['raw']:
-                raw_val = temp_attr['raw']['value']
-                attributes['temperature_c'] = raw_val & 0xFF  # Extract lowest byte
-
-        if SMARTAttribute.REALLOCATED_SECTORS in attr_lookup:
-            attributes['reallocated_sectors'] = attr_lookup[SMARTAttribute.REALLOCATED_SECTORS]['raw']['value']
-
-        if SMARTAttribute.PENDING_SECTORS in attr_lookup:
-            attributes['pending_sectors'] = attr_lookup[SMARTAttribute.PENDING_SECTORS]['raw']['value']
-
-        if SMARTAttribute.UNCORRECTABLE_SECTORS in attr_lookup:
-            attributes['uncorrectable_sectors'] = attr_lookup[SMARTAttribute.UNCORRECTABLE_SECTORS]['raw']['value']
-
-        if SMARTAttribute.RESERVED_SPACE in attr_lookup:
-            attributes['reserved_space_pct'] = attr_lookup[SMARTAttribute.RESERVED_SPACE]['value']
-
-        # Wear level - try multiple vendor-specific attributes
-        # All these attributes report "remaining life %" (100=new, 0=dead)
-        # Convert to "wear consumed %" by inverting: wear = 100 - remaining
-        if SMARTAttribute.WEAR_LEVELING in attr_lookup:
-            # Attr 177: Samsung Wear_Leveling_Count (100=new, decreases with wear)
-            remaining = attr_lookup[SMARTAttribute.WEAR_LEVELING]['value']
-            attributes['wear_level_pct'] = 100 - remaining
-        elif SMARTAttribute.SSD_LIFE_LEFT in attr_lookup:
-            # Attr 231: SSD_Life_Left (100=new, decreases with wear)
-            remaining = attr_lookup[SMARTAttribute.SSD_LIFE_LEFT]['value']
-            attributes['wear_level_pct'] = 100 - remaining
-        elif SMARTAttribute.MEDIA_WEAROUT in attr_lookup:
-            # Attr 233: Intel Media_Wearout_Indicator (100=new, 0=worn)
-            remaining = attr_lookup[SMARTAttribute.MEDIA_WEAROUT]['value']
-            attributes['wear_level_pct'] = 100 - remaining
-
-        # Total data written - handle vendor-specific differences
-        # Samsung/Intel: Attribute 241 is raw LBA count (multiply by 512)
-        # WD/Kingston/SanDisk: Attribute 241 is already in GB
-        # Crucial: Attribute 246 named "Total_LBAs_Written" (LBA count)
-        # Micron: Attribute 246 named "Host_Writes_32MiB" (32 MiB units)
-
-        tb_written = None
-        data_written_raw = None
-
-        # Check attribute 241 or 246
-        write_attr = None
-        if SMARTAttribute.TOTAL_LBAS_WRITTEN in attr_lookup:
-            write_attr = attr_lookup[SMARTAttribute.TOTAL_LBAS_WRITTEN]
-        elif SMARTAttribute.HOST_WRITES_32MIB in attr_lookup:
-            write_attr = attr_lookup[SMARTAttribute.HOST_WRITES_32MIB]
-
-        if write_attr:
-            raw_value = write_attr['raw']['value']
-            attr_name = write_attr.get('name', '')
-
-            # Check if attribute is specifically "Host_Writes_32MiB"
-            if 'Host_Writes_32MiB' in attr_name or '32MiB' in attr_name:
-                # Micron style: value is in 32 MiB units
-                data_written_raw = raw_value
-                tb_written = round((raw_value * 32) / (1024 * 1024), 2)
-            else:
-                # Standard LBA-based attribute (Crucial/Samsung/WD/Kingston)
-                # Heuristic: If value > 100,000, likely LBAs (Samsung/Intel/Crucial style)
-                # If value < 100,000, likely already in GB (WD/Kingston style)
-                if raw_value > 100000:
-                    # Treat as LBA count - multiply by 512 bytes
-                    data_written_raw = raw_value
-                    tb_written = round((raw_value * 512) / (1024**4), 2)
-                else:
-                    # Treat as GB already - convert to TB
-                    data_written_raw = raw_value
-                    tb_written = round(raw_value / 1024, 2)
-
-        if data_written_raw is not None:
-            attributes['total_lbas_written'] = data_written_raw
-        if tb_written is not None:
-            attributes['total_tb_written'] = tb_written
-
-    except Exception as e:
-        print(f"WARNING: Error extracting SMART attributes: {e}")
-
-    return attributes
-
-
-def get_health_status(smartctl_data):
-    """Extract overall health status"""
-    if not smartctl_data:
-        return 'N/A'
-
-    try:
-        if 'smart_status' in smartctl_data:
-            passed = smartctl_data['smart_status'].get('passed', False)
-            return 'PASSED' if passed else 'FAILED'
-    except Exception:
-        pass
-
-    return 'N/A'
-
-
-def get_self_test_result(smartctl_data):
-    """Extract last self-test result"""
-    if not smartctl_data:
-        return 'N/A'
+        return parsed
+
+    get = smartctl_data.get
+
+    # Device identification
+    parsed['model'] = get('model_name', get('model_family'))
+    parsed['serial'] = get('serial_number')
+    parsed['firmware'] = get('firmware_version')
+    capacity = get('user_capacity')
+    if capacity is not None:
+        parsed['capacity_gb'] = round(capacity.get('bytes', 0) / (1024**3), 2)
+
+    # Overall health and last self-test
+    smart_status = get('smart_status')
+    if smart_status is not None:
+        parsed['health_status'] = 'PASSED' if smart_status.get('passed', False) else 'FAILED'
+    status = get('ata_smart_data', {}).get('self_test', {}).get('status', {})
+    if 'passed' in status:
+        parsed['self_test_result'] = 'PASSED' if status['passed'] else 'FAILED'
+
+    # Extract temperature from top-level JSON field (more reliable)
+    temperature = get('temperature', {})
+    if 'current' in temperature:
+        parsed['temperature_c'] = temperature['current']
+
+    # Single pass over the SMART table, dispatching on attribute ID;
+    # anything not mapped directly is kept for the vendor post-pass,
+    # in a list indexed by ID (SMART attribute IDs are a single byte)
+    other = [None] * 256
+    for attr in get('ata_smart_attributes', {}).get('table', []):
+        attr_id = attr.get('id', 0)  # 0 is not a valid attribute ID
+        entry = _EXTRACTORS.get(attr_id)
+        if entry:
+            field, extract = entry
+            parsed[field] = extract(attr)
+        else:
+            other[attr_id] = attr
+
+    # Temperature fallback: if not found at top level, use SMART attribute
+    temp_attr = other[SMARTAttribute.TEMPERATURE]
+    if parsed['temperature_c'] is None and temp_attr is not None:
+        parsed['temperature_c'] = _temp_value(temp_attr)
+
+    # Wear level - try multiple vendor-specific attributes
+    # All these attributes report "remaining life %" (100=new, 0=dead)
+    # Convert to "wear consumed %" by inverting: wear = 100 - remaining
+    # Attr 177: Samsung Wear_Leveling_Count (100=new, decreases with wear)
+    # Attr 231: SSD_Life_Left (100=new, decreases with wear)
+    # Attr 233: Intel Media_Wearout_Indicator (100=new, 0=worn)
+    for attr_id in _WEAR_ATTRS:
+        attr = other[attr_id]
+        if attr is not None and 'value' in attr:
+            parsed['wear_level_pct'] = 100 - attr['value']
+            break
 
-    try:
-        if 'ata_smart_data' in smartctl_data:
-            self_test = smartctl_data['ata_smart_data'].get('self_test', {})
-            status = self_test.get('status', {})
-            if 'passed' in status:
-                return 'PASSED' if status['passed'] else 'FAILED'
-    except Exception:
-        pass
+    # Total data written - handle vendor-specific differences
+    # Samsung/Intel: Attribute 241 is raw LBA count (multiply by 512)
+    # WD/Kingston/SanDisk: Attribute 241 is already in GB
+    # Crucial: Attribute 246 named "Total_LBAs_Written" (LBA count)
+    # Micron: Attribute 246 named "Host_Writes_32MiB" (32 MiB units)
+    for attr_id in _WRITE_ATTRS:
+        attr = other[attr_id]
+        if attr is not None:
+            parsed['total_lbas_written'], parsed['total_tb_written'] = _data_written(attr)
+            break
 
-    return 'N/A'
+    return parsed
 
 
-def generate_warnings(device_info, attributes, health_status):
+def generate_warnings(attributes):
     """Generate warning messages based on drive health metrics"""
     warnings = []
 
     # Check health status
-    if health_status == 'FAILED':
+    if attributes['health_status'] == 'FAILED':
         warnings.append('SMART_HEALTH_FAILED')
 
-    # Check for sector errors
-    try:
-        if attributes['reallocated_sectors'] != 'N/A' and int(attributes['reallocated_sectors']) > 0:
-            warnings.append(f"REALLOCATED_SECTORS:{attributes['reallocated_sectors']}")
-
-        if attributes['pending_sectors'] != 'N/A' and int(attributes['pending_sectors']) > 0:
-            warnings.append(f"PENDING_SECTORS:{attributes['pending_sectors']}")
-
-        if attributes['uncorrectable_sectors'] != 'N/A' and int(attributes['uncorrectable_sectors']) > 0:
-            warnings.append(f"UNCORRECTABLE_SECTORS:{attributes['uncorrectable_sectors']}")
-    except (ValueError, TypeError):
-        pass
+    # Check for sector errors (values are ints, or None if not reported)
+    for label, key in (('REALLOCATED_SECTORS', 'reallocated_sectors'),
+                       ('PENDING_SECTORS', 'pending_sectors'),
+                       ('UNCORRECTABLE_SECTORS', 'uncorrectable_sectors')):
+        value = attributes[key]
+        if value:
+            warnings.append(f"{label}:{value}")
 
     # Check temperature
-    try:
-        if attributes['temperature_c'] != 'N/A':
-            temp = int(attributes['temperature_c'])
-            if temp > 70:
-                warnings.append(f"HIGH_TEMP:{temp}C")
-    except (ValueError, TypeError):
-        pass
+    temp = attributes['temperature_c']
+    if temp is not None and temp > 70:
+        warnings.append(f"HIGH_TEMP:{temp}C")
 
     # Check wear level
-    try:
-        if attributes['wear_level_pct'] != 'N/A':
-            wear = int(attributes['wear_level_pct'])
-            if wear > 80:
-                warnings.append(f"HIGH_WEAR:{wear}%")
-    except (ValueError, TypeError):
-        pass
+    wear = attributes['wear_level_pct']
+    if wear is not None and wear > 80:
+        warnings.append(f"HIGH_WEAR:{wear}%")
 
     return ', '.join(warnings) if warnings else 'None'
 
 
-def test_drive(device_path):
+def test_drive(device_path, full=False):
     """Test a single drive and return results dictionary"""
     print(f"\n{Colors.info('Testing drive:')} {Colors.header(device_path)}")
     print(Colors.info("Running smartctl commands..."))
 
-    # Run smartctl with comprehensive options
-    data, returncode = run_smartctl(device_path, ['-x'])
+    # Only request the sections we read; -x is much slower and larger
+    options = SMARTCTL_FULL_OPTIONS if full else SMARTCTL_OPTIONS
+    data, returncode = run_smartctl(device_path, options)
 
     if data is None:
-        print(Colors.error("ERROR: Failed to get smartctl data"))
+        print(Colors.error(f"ERROR: Failed to get smartctl data for {device_path}"))
         return None
 
-    # Extract all information
-    device_info = extract_device_info(data)
-    attributes = extract_smart_attributes(data)
-    health_status = get_health_status(data)
-    self_test_result = get_self_test_result(data)
-    warnings = generate_warnings(device_info, attributes, health_status)
+    # Extract all information in one pass
+    parsed = parse_smartctl(data)
 
     # Compile results
     results = {
-        'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-        'model': device_info['model'],
-        'serial': device_info['serial'],
-        'firmware': device_info['firmware'],
-        'capacity_gb': device_info['capacity_gb'],
-        'health_status': health_status,
-        'power_on_hours': attributes['power_on_hours'],
-        'power_cycles': attributes['power_cycles'],
-        'temperature_c': attributes['temperature_c'],
-        'total_lbas_written': attributes['total_lbas_written'],
-        'total_tb_written': attributes['total_tb_written'],
-        'wear_level_pct': attributes['wear_level_pct'],
-        'reserved_space_pct': attributes['reserved_space_pct'],
-        'reallocated_sectors': attributes['reallocated_sectors'],
-        'pending_sectors': attributes['pending_sectors'],
-        'uncorrectable_sectors': attributes['uncorrectable_sectors'],
-        'self_test_result': self_test_result,
-        'warnings': warnings
+        'timestamp': datetime.now().isoformat(sep=' ', timespec='seconds'),
+        **parsed,
+        'warnings': generate_warnings(parsed)
     }
 
     return results
@@ -456,112 +479,90 @@ def display_results(results):
     # Determine health status color
     health = results['health_status']
     if health == 'PASSED':
-        health_colored = Colors.success(health)
+        health_colored = success(health)
     elif health == 'FAILED':
-        health_colored = Colors.error(health)
-    else:
-        health_colored = health
-
-    # Color temperature based on value
-    temp = results['temperature_c']
-    if temp != 'N/A':
-        try:
-            temp_val = int(temp)
-            if temp_val > 70:
-                temp_colored = Colors.error(f"{temp}°C")
-            elif temp_val > 60:
-                temp_colored = Colors.warning(f"{temp}°C")
-            else:
-                temp_colored = f"{temp}°C"
-        except (ValueError, TypeError):
-            temp_colored = f"{temp}°C"
-    else:
-        temp_colored = temp
-
-    # Color wear level
-    wear = results['wear_level_pct']
-    if wear != 'N/A':
-        try:
-            wear_val = int(wear)
-            if wear_val > 80:
-                wear_colored = Colors.error(f"{wear}%")
-            elif wear_val > 50:
-                wear_colored = Colors.warning(f"{wear}%")
-            else:
-                wear_colored = Colors.success(f"{wear}%")
-        except (ValueError, TypeError):
-            wear_colored = f"{wear}%"
+        health_colored = error(health)
     else:
-        wear_colored = wear
+        health_colored = _fmt(health)
 
-    # Color sector errors
-    def color_sectors(value):
-        if value != 'N/A':
-            try:
-                if int(value) > 0:
-                    return Colors.error(str(value))
-                else:
-                    return Colors.success(str(value))
-            except (ValueError, TypeError):
-                pass
-        return str(value)
+    # Color temperature, wear level and sector errors by severity
+    temp_colored = _sev(results['temperature_c'], 61, 71, '°C', _TEMP_SEV)
+    wear_colored = _sev(results['wear_level_pct'], 51, 81, '%')
 
     # Color warnings
     warnings = results['warnings']
     if warnings == 'None':
-        warnings_colored = Colors.success(warnings)
+        warnings_colored = _WARN_NONE
     else:
-        warnings_colored = Colors.error(warnings)
-
-    print("\n" + Colors.header("="*60))
-    print(Colors.header("DRIVE TEST RESULTS"))
-    print(Colors.header("="*60))
-    print(f"Model:           {Colors.info(results['model'])}")
-    print(f"Serial:          {results['serial']}")
-    print(f"Firmware:        {results['firmware']}")
-    print(f"Capacity:        {results['capacity_gb']} GB")
+        warnings_colored = error(warnings)
+
+    print("\n" + _HEADER_BAR)
+    print(header("DRIVE TEST RESULTS"))
+    print(_HEADER_BAR)
+    print(f"Model:           {info(_fmt(results['model']))}")
+    print(f"Serial:          {_fmt(results['serial'])}")
+    print(f"Firmware:        {_fmt(results['firmware'])}")
+    print(f"Capacity:        {_fmt(results['capacity_gb'])} GB")
     print(f"Health Status:   {health_colored}")
-    print("-"*60)
-    print(f"Power-On Hours:  {results['power_on_hours']}")
-    print(f"Power Cycles:    {results['power_cycles']}")
+    print(_DASH_BAR)
+    print(f"Power-On Hours:  {_fmt(results['power_on_hours'])}")
+    print(f"Power Cycles:    {_fmt(results['power_cycles'])}")
     print(f"Temperature:     {temp_colored}")
-    print(f"Total Written:   {results['total_tb_written']} TB")
+    print(f"Total Written:   {_fmt(results['total_tb_written'])} TB")
     print(f"Wear Level:      {wear_colored}")
-    print("-"*60)
-    print(f"Reallocated:     {color_sectors(results['reallocated_sectors'])}")
-    print(f"Pending:         {color_sectors(results['pending_sectors'])}")
-    print(f"Uncorrectable:   {color_sectors(results['uncorrectable_sectors'])}")
-    print("-"*60)
+    print(_DASH_BAR)
+    print(f"Reallocated:     {_sev(results['reallocated_sectors'], 1, 1)}")
+    print(f"Pending:         {_sev(results['pending_sectors'], 1, 1)}")
+    print(f"Uncorrectable:   {_sev(results['uncorrectable_sectors'], 1, 1)}")
+    print(_DASH_BAR)
     print(f"Warnings:        {warnings_colored}")
-    print(Colors.header("="*60))
-
+    print(_HEADER_BAR)
+
+
+class CSVLogger:
+    """Keeps one CSV file and writer open for a whole test session"""
+
+    def __init__(self, path, flush=False):
+        self.path = path
+        self.flush = flush  # Flush every row so a crash loses nothing
+        self.f = None
+        self.w = None
+        self._fields = CSV_FIELDNAMES
+
+    def write(self, row):
+        """Append one results row, opening the file on first use"""
+        if self.f is None:
+            # Opened lazily so quitting before any test leaves no file behind
+            self.f = open(self.path, 'a', newline='', encoding='utf-8', buffering=1 << 16)
+            # Plain writer: rows are built in column order below, which
+            # skips DictWriter's per-row dict-to-list reordering
+            self.w = csv.writer(self.f)
+            # Write header if new file
+            if self.f.tell() == 0:
+                self.w.writerow(self._fields)
+        # Missing values are only turned into N/A here, at output time
+        self.w.writerow([_fmt(row[k]) for k in self._fields])
+        if self.flush:
+            self.f.flush()
 
-def save_to_csv(results, csv_filename):
-    """Save test results to CSV file"""
-    # Define CSV columns
-    fieldnames = [
-        'timestamp', 'model', 'serial', 'firmware', 'capacity_gb',
-        'health_status', 'power_on_hours', 'power_cycles', 'temperature_c',
-        'total_lbas_written', 'total_tb_written', 'wear_level_pct',
-        'reserved_space_pct', 'reallocated_sectors', 'pending_sectors',
-        'uncorrectable_sectors', 'self_test_result', 'warnings'
-    ]
-
-    # Check if file exists to determine if we need to write header
-    file_exists = Path(csv_filename).exists()
+    def close(self):
+        """Close the CSV file if it was opened"""
+        if self.f is not None:
+            self.f.close()
+            self.f = None
 
-    try:
-        with open(csv_filename, 'a', newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+    def __enter__(self):
+        return self
 
-            # Write header if new file
-            if not file_exists:
-                writer.writeheader()
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
 
-            # Write results row
-            writer.writerow(results)
 
-        print(f"\n{Colors.success('Results saved to:')} {csv_filename}")
+def save_to_csv(results, csv_logger):
+    """Save test results to CSV file"""
+    try:
+        csv_logger.write(results)
+        print(f"\n{Colors.success('Results saved to:')} {csv_logger.path}")
         return True
 
     except Exception as e:
@@ -569,27 +570,15 @@ def save_to_csv(results, csv_filename):
         return False
 
 
-def main():
-    """Main script execution"""
-    print(Colors.header("="*60))
-    print(Colors.header("SSD TESTING SCRIPT"))
-    print(Colors.header("="*60))
-
-    # Check dependencies
-    if not check_dependencies():
-        sys.exit(1)
-
-    # Generate CSV filename with timestamp
-    csv_filename = f"ssd_test_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-
-    # Main testing loop
+def run_interactive(csv_logger, full=False):
+    """Prompt for drives one at a time; return number of drives tested"""
     drives_tested = 0
     last_device = None  # Remember last device used
 
     while True:
-        print("\n" + Colors.header("="*60))
+        print("\n" + _HEADER_BAR)
         print(Colors.header("AVAILABLE BLOCK DEVICES"))
-        print(Colors.header("="*60))
+        print(_HEADER_BAR)
 
         # List available devices
         devices = list_block_devices()
@@ -639,29 +628,104 @@ def main():
             continue
 
         # Test the drive
-        results = test_drive(device_input)
+        results = test_drive(device_input, full=full)
 
         if results:
             # Display results
             display_results(results)
 
             # Save to CSV
-            save_to_csv(results, csv_filename)
+            save_to_csv(results, csv_logger)
 
             drives_tested += 1
             last_device = device_input  # Remember this device
 
         # Ask to test another drive
-        print("\n" + "="*60)
+        print("\n" + _PLAIN_BAR)
         response = input("Test another drive? (y/n): ").strip().lower()
         if response != 'y':
             break
 
+    return drives_tested
+
+
+def run_batch(device_paths, csv_logger, full=False):
+    """Test several drives concurrently; return (drives tested, failed paths)"""
+    drives_tested = 0
+    failed = []
+
+    # smartctl spends its time waiting on the drive, so one thread per
+    # drive lets drives on separate USB buses be queried in parallel
+    with ThreadPoolExecutor(max_workers=len(device_paths)) as executor:
+        futures = {executor.submit(test_drive, path, full): path for path in device_paths}
+        for future in as_completed(futures):
+            path = futures[future]
+            try:
+                results = future.result()
+            except Exception as e:
+                # Keep going so drives that already finished are still saved
+                print(Colors.error(f"ERROR: Unexpected error testing {path}: {e}"))
+                results = None
+
+            if results:
+                display_results(results)
+                save_to_csv(results, csv_logger)
+                drives_tested += 1
+            else:
+                print(Colors.error(f"FAILED: {path}"))
+                failed.append(path)
+
+    return drives_tested, failed
+
+
+def parse_args():
+    """Parse command-line arguments"""
+    parser = argparse.ArgumentParser(description="Test SSD drives with smartctl and log results to CSV")
+    parser.add_argument('--full', action='store_true',
+                        help="query comprehensive smartctl data (-x) instead of only the needed sections")
+    parser.add_argument('--batch', metavar='DEVICES',
+                        help="test a comma-separated list of drives (e.g. /dev/sdb,/dev/sdc) in parallel, without prompts")
+    return parser.parse_args()
+
+
+def main():
+    """Main script execution"""
+    args = parse_args()
+
+    print(_HEADER_BAR)
+    print(Colors.header("SSD TESTING SCRIPT"))
+    print(_HEADER_BAR)
+
+    # Check dependencies
+    if not check_dependencies():
+        sys.exit(1)
+
+    # Generate CSV filename with timestamp
+    csv_filename = f"ssd_test_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+
+    failed = []
+    if args.batch:
+        # Drop duplicates so one drive is never queried twice at once
+        device_paths = list(dict.fromkeys(p.strip() for p in args.batch.split(',') if p.strip()))
+        invalid = [p for p in device_paths if not validate_device_path(p)]
+        if invalid or not device_paths:
+            print(Colors.error(f"ERROR: Invalid device path(s): {', '.join(invalid) or args.batch}"))
+            print("Expected format: /dev/sd[a-z],/dev/sd[a-z],...")
+            sys.exit(1)
+        with CSVLogger(csv_filename) as csv_logger:
+            drives_tested, failed = run_batch(device_paths, csv_logger, full=args.full)
+    else:
+        # Rows arrive minutes apart, so flush each one to survive a crash
+        with CSVLogger(csv_filename, flush=True) as csv_logger:
+            drives_tested = run_interactive(csv_logger, full=args.full)
+
     # Summary
-    print("\n" + Colors.header("="*60))
+    print("\n" + _HEADER_BAR)
     print(Colors.header("TESTING COMPLETE"))
-    print(Colors.header("="*60))
+    print(_HEADER_BAR)
     print(f"Total drives tested: {Colors.success(str(drives_tested))}")
+    if failed:
+        print(f"Failed drives:       {Colors.error(', '.join(sorted(failed)))}")
     if drives_tested > 0:
         print(f"Results saved to: {Colors.info(csv_filename)}")
     print("\nThank you for using SSD Testing Script!")